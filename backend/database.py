@@ -1,17 +1,29 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import OperationFailure
 from models import Game, UserProgress, GameGroup
+from search_index import GameSearchIndex, search_tokens, tokenize
 import os
+import re
+import asyncio
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Error codes meaning the backend can't run the searchTokens queries at all
+# (CommandNotSupported, NotImplemented). Anything else is a real failure.
+SEARCH_UNSUPPORTED_CODES = {115, 238}
+
 class Database:
     def __init__(self, mongo_url: str, db_name: str):
         self.client = AsyncIOMotorClient(mongo_url)
         self.db = self.client[db_name]
         self.games = self.db.games
         self.user_progress = self.db.user_progress
+        # In-memory fallback, only built when the backend can't query searchTokens
+        self.search_index = None
+        self._search_index_lock = asyncio.Lock()
         
     async def close(self):
         self.client.close()
@@ -19,11 +31,16 @@ class Database:
     # Game CRUD Operations
     async def create_game(self, game: Game) -> Game:
         game_dict = game.dict()
+        game_dict["searchTokens"] = search_tokens(game_dict)
         await self.games.insert_one(game_dict)
+        if self.search_index is not None:
+            self.search_index.add(game_dict)
         return game
 
     async def get_games_by_level(self, level: str) -> list:
-        games = await self.games.find({"level": level, "isDaily": False}).to_list(1000)
+        games = await self.games.find(
+            {"level": level, "isDaily": False}, {"searchTokens": 0}
+        ).to_list(1000)
         # Convert ObjectId to string for JSON serialization
         for game in games:
             if '_id' in game:
@@ -42,7 +59,7 @@ class Database:
         return levels
 
     async def get_game_by_id(self, game_id: str) -> dict:
-        game = await self.games.find_one({"id": game_id})
+        game = await self.games.find_one({"id": game_id}, {"searchTokens": 0})
         if game and '_id' in game:
             del game['_id']
         return game
@@ -53,7 +70,7 @@ class Database:
             "level": level,
             "isDaily": True,
             "dailyDate": date
-        })
+        }, {"searchTokens": 0})
         
         if daily_game:
             if '_id' in daily_game:
@@ -82,17 +99,129 @@ class Database:
             "isDaily": True,
             "dailyDate": date
         }
+        daily_game["searchTokens"] = search_tokens(daily_game)
         
         # Store daily game (check if it already exists first)
         existing = await self.games.find_one({"id": daily_game["id"]})
         if not existing:
             await self.games.insert_one(daily_game)
+            if self.search_index is not None:
+                self.search_index.add(daily_game)
         
-        # Remove _id for JSON serialization
-        if '_id' in daily_game:
-            del daily_game['_id']
+        # Remove _id and search tokens for JSON serialization
+        daily_game.pop('_id', None)
+        daily_game.pop('searchTokens', None)
         return daily_game
 
+    # Game Search
+    async def ensure_indexes(self):
+        await self.games.create_index([("id", ASCENDING)], name="id")
+        await self.games.create_index(
+            [("level", ASCENDING), ("isDaily", ASCENDING), ("id", ASCENDING)],
+            name="level_daily_id"
+        )
+        await self.games.create_index(
+            [("dailyDate", ASCENDING), ("id", ASCENDING)], name="daily_date_id"
+        )
+        try:
+            await self._backfill_search_tokens()
+            await self.games.create_index(
+                [("searchTokens", ASCENDING), ("id", ASCENDING)], name="search_tokens_id"
+            )
+        except OperationFailure as e:
+            if e.code not in SEARCH_UNSUPPORTED_CODES:
+                raise
+            logger.warning(f"Search token index unavailable, using in-memory search index: {e}")
+            await self._build_search_index()
+
+    async def _backfill_search_tokens(self):
+        # Games stored before search existed have no searchTokens field yet
+        projection = {"_id": 1, "title": 1, "groups.category": 1, "words": 1}
+        updates = []
+        async for game in self.games.find({"searchTokens": {"$exists": False}}, projection):
+            updates.append(UpdateOne(
+                {"_id": game["_id"]}, {"$set": {"searchTokens": search_tokens(game)}}
+            ))
+        if updates:
+            await self.games.bulk_write(updates, ordered=False)
+            logger.info(f"Backfilled search tokens for {len(updates)} games")
+
+    async def _build_search_index(self):
+        async with self._search_index_lock:
+            if self.search_index is not None:
+                return
+            # Publish before scanning so inserts made during the scan are indexed too;
+            # searches wait on the lock, so they never see a partial index
+            search_index = GameSearchIndex()
+            self.search_index = search_index
+            projection = {"_id": 0, "id": 1, "level": 1, "title": 1, "isDaily": 1,
+                          "dailyDate": 1, "groups.category": 1, "words": 1}
+            try:
+                async for game in self.games.find({}, projection):
+                    if game["id"] not in search_index:
+                        search_index.add(game)
+            except Exception:
+                # Don't keep serving a partial index; the next search retries the build
+                self.search_index = None
+                raise
+            logger.info(f"Built in-memory search index with {len(search_index)} games")
+
+    async def search_games(self, query: str = None, level: str = None, is_daily: bool = None,
+                           date_from: str = None, date_to: str = None, cursor: str = None,
+                           limit: int = 20) -> dict:
+        # Fetch one extra result to know whether there is a next page
+        if self.search_index is None:
+            try:
+                games = await self._search_games_mongo(
+                    query, level, is_daily, date_from, date_to, cursor, limit + 1
+                )
+            except OperationFailure as e:
+                if e.code not in SEARCH_UNSUPPORTED_CODES:
+                    raise
+                logger.warning(f"Search unsupported by backend, using in-memory search index: {e}")
+                await self._build_search_index()
+        if self.search_index is not None:
+            async with self._search_index_lock:
+                games = self.search_index.search(
+                    query, level, is_daily, date_from, date_to, cursor, limit + 1
+                )
+
+        next_cursor = None
+        if len(games) > limit:
+            games = games[:limit]
+            next_cursor = games[-1]["id"]
+        return {"games": games, "nextCursor": next_cursor}
+
+    async def _search_games_mongo(self, query, level, is_daily, date_from, date_to,
+                                  cursor, limit) -> list:
+        filters = {}
+        terms = tokenize(query) if query else []
+        if terms:
+            # Anchored, case-sensitive prefixes so each term is a range scan on searchTokens
+            filters["searchTokens"] = {"$in": [re.compile("^" + re.escape(term)) for term in terms]}
+        if level is not None:
+            filters["level"] = level
+        if is_daily is not None:
+            filters["isDaily"] = is_daily
+        if date_from is not None or date_to is not None:
+            filters["dailyDate"] = {}
+            if date_from is not None:
+                filters["dailyDate"]["$gte"] = date_from
+            if date_to is not None:
+                filters["dailyDate"]["$lte"] = date_to
+        if cursor:
+            filters["id"] = {"$gt": cursor}
+
+        projection = {"_id": 0, "id": 1, "level": 1, "title": 1, "isDaily": 1,
+                      "dailyDate": 1, "groups.category": 1}
+        # Server-side limit so MongoDB does a top-k sort instead of sorting every match
+        games = await self.games.find(filters, projection).sort("id", ASCENDING).limit(limit).to_list(limit)
+        for game in games:
+            game.setdefault("isDaily", False)
+            game.setdefault("dailyDate", None)
+            game.setdefault("groups", [])
+        return games
+
     # User Progress CRUD Operations
     async def get_user_progress(self, user_id: str) -> dict:
         progress = await self.user_progress.find_one({"userId": user_id})
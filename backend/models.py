@@ -87,6 +87,21 @@ class GameLevelsResponse(BaseModel):
     hard: Dict
     youth: Dict
 
+class GameGroupSummary(BaseModel):
+    category: str
+
+class GameSearchResult(BaseModel):
+    id: str
+    level: str
+    title: str
+    isDaily: bool = False
+    dailyDate: Optional[str] = None
+    groups: List[GameGroupSummary] = []
+
+class GameSearchResponse(BaseModel):
+    games: List[GameSearchResult]
+    nextCursor: Optional[str] = None  # pass back as `cursor` to fetch the next page
+
 class StatsResponse(BaseModel):
     totalGamesCompleted: int
     totalPerfectGames: int
@@ -0,0 +1,124 @@
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set
+import re
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+def search_tokens(game: dict) -> List[str]:
+    """Lowercased tokens from a game's title, group categories and words"""
+    tokens = set(tokenize(game.get("title", "")))
+    for group in game.get("groups", []):
+        tokens.update(tokenize(group.get("category", "")))
+    for word in game.get("words", []):
+        tokens.update(tokenize(word))
+    return sorted(tokens)
+
+def game_summary(game: dict) -> dict:
+    """Project a game down to the fields returned by search"""
+    return {
+        "id": game["id"],
+        "level": game["level"],
+        "title": game["title"],
+        "isDaily": game.get("isDaily", False),
+        "dailyDate": game.get("dailyDate"),
+        "groups": [{"category": group["category"]} for group in game.get("groups", [])]
+    }
+
+class GameSearchIndex:
+    """In-memory inverted index over game titles, group categories and words.
+
+    Used by Database.search_games when the backend can't query the indexed
+    `searchTokens` field. Matching is the same on both paths: each query term
+    is a prefix of some token from `search_tokens`, and any matching term is
+    enough. Only inserts made through this process are picked up.
+    """
+
+    def __init__(self):
+        self._games: Dict[str, dict] = {}
+        self._game_tokens: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._vocabulary: List[str] = []
+        self._sorted_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._games
+
+    def add(self, game: dict):
+        game_id = game["id"]
+        if game_id in self._games:
+            self.remove(game_id)
+
+        tokens = set(search_tokens(game))
+
+        self._games[game_id] = game_summary(game)
+        self._game_tokens[game_id] = tokens
+        for token in tokens:
+            if token not in self._postings:
+                self._postings[token] = set()
+                self._vocabulary.insert(bisect_left(self._vocabulary, token), token)
+            self._postings[token].add(game_id)
+        self._sorted_ids.insert(bisect_left(self._sorted_ids, game_id), game_id)
+
+    def remove(self, game_id: str):
+        if game_id not in self._games:
+            return
+        del self._games[game_id]
+        for token in self._game_tokens.pop(game_id):
+            postings = self._postings[token]
+            postings.discard(game_id)
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+        del self._sorted_ids[bisect_left(self._sorted_ids, game_id)]
+
+    def _match_term(self, term: str) -> Set[str]:
+        matches = set()
+        position = bisect_left(self._vocabulary, term)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(term):
+            matches.update(self._postings[self._vocabulary[position]])
+            position += 1
+        return matches
+
+    def search(self, query: Optional[str] = None, level: Optional[str] = None,
+               is_daily: Optional[bool] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, cursor: Optional[str] = None,
+               limit: int = 20) -> List[dict]:
+        """Return up to `limit` matching summaries ordered by id, starting after `cursor`"""
+        candidates = None
+        terms = tokenize(query) if query else []
+        if terms:
+            candidates = set()
+            for term in terms:
+                candidates.update(self._match_term(term))
+
+        start = bisect_left(self._sorted_ids, cursor) if cursor else 0
+        if cursor and start < len(self._sorted_ids) and self._sorted_ids[start] == cursor:
+            start += 1
+
+        results = []
+        for game_id in self._sorted_ids[start:]:
+            if candidates is not None and game_id not in candidates:
+                continue
+            game = self._games[game_id]
+            if level is not None and game["level"] != level:
+                continue
+            if is_daily is not None and game["isDaily"] != is_daily:
+                continue
+            if date_from is not None or date_to is not None:
+                daily_date = game["dailyDate"]
+                if daily_date is None:
+                    continue
+                if date_from is not None and daily_date < date_from:
+                    continue
+                if date_to is not None and daily_date > date_to:
+                    continue
+            results.append(game)
+            if len(results) >= limit:
+                break
+        return results
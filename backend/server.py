@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Query
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 from pathlib import Path
@@ -6,11 +6,12 @@ import os
 import logging
 from datetime import datetime
 import uuid
+from typing import Optional
 
 # Import models and database
 from models import (
     Game, GameCreate, UserProgress, GameCompleteRequest, 
-    DailyGameCompleteRequest, GameLevelsResponse, StatsResponse
+    DailyGameCompleteRequest, GameLevelsResponse, StatsResponse, GameSearchResponse
 )
 from database import Database
 
@@ -88,6 +89,40 @@ async def get_level_games(level_key: str):
         logger.error(f"Error fetching level {level_key}: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch level {level_key}")
 
+@api_router.get("/games/search", response_model=GameSearchResponse)
+async def search_games(
+    q: Optional[str] = Query(default=None, max_length=200),
+    level: Optional[str] = None,
+    daily: Optional[bool] = None,
+    date_from: Optional[str] = Query(default=None, alias="dateFrom"),
+    date_to: Optional[str] = Query(default=None, alias="dateTo"),
+    cursor: Optional[str] = None,
+    limit: int = Query(default=20, ge=1, le=100)
+):
+    """Search games by title, category or word with optional filters"""
+    try:
+        if level is not None and level not in ['easy', 'medium', 'hard', 'youth']:
+            raise HTTPException(status_code=400, detail="Invalid level")
+
+        # Normalise to zero-padded YYYY-MM-DD so dates compare correctly with stored dailyDate
+        try:
+            if date_from is not None:
+                date_from = datetime.strptime(date_from, '%Y-%m-%d').strftime('%Y-%m-%d')
+            if date_to is not None:
+                date_to = datetime.strptime(date_to, '%Y-%m-%d').strftime('%Y-%m-%d')
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Dates must be YYYY-MM-DD")
+
+        return await database.search_games(
+            query=q.strip() if q else None, level=level, is_daily=daily,
+            date_from=date_from, date_to=date_to, cursor=cursor, limit=limit
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error searching games: {e}")
+        raise HTTPException(status_code=500, detail="Failed to search games")
+
 @api_router.get("/games/{game_id}")
 async def get_game(game_id: str):
     """Get specific game data"""
@@ -244,6 +279,11 @@ app.include_router(api_router)
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting up Brain Connections API...")
+    try:
+        await database.ensure_indexes()
+        logger.info("Database indexes ready")
+    except Exception as e:
+        logger.error(f"Error creating database indexes: {e}")
     try:
         await database.seed_games()
         logger.info("Database seeding completed successfully")
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from database import Database
+
+
+def make_game(game_id, title="Colors and Shapes", category="Animals", words=("DOG", "CAT")):
+    return {
+        "id": game_id,
+        "level": "easy",
+        "title": title,
+        "words": list(words),
+        "groups": [{"category": category, "words": list(words), "difficulty": 1}],
+        "isDaily": False,
+        "dailyDate": None,
+    }
+
+
+class FakeCursor:
+    def __init__(self, collection, filters):
+        self.collection = collection
+        self.filters = filters
+        self.server_limit = None
+
+    def sort(self, key, direction):
+        return self
+
+    def limit(self, limit):
+        self.server_limit = limit
+        return self
+
+    def _results(self):
+        games = sorted(self.collection.games, key=lambda game: game["id"])
+        cursor = self.filters.get("id", {}).get("$gt")
+        if cursor:
+            games = [game for game in games if game["id"] > cursor]
+        if self.server_limit is not None:
+            games = games[:self.server_limit]
+        return [dict(game) for game in games]
+
+    async def to_list(self, length):
+        if self.collection.error is not None:
+            raise self.collection.error
+        return self._results()[:length]
+
+    def __aiter__(self):
+        async def iterate():
+            for game in self._results():
+                yield game
+        return iterate()
+
+
+class FakeGames:
+    """Just enough of a Motor collection for Database.search_games"""
+
+    def __init__(self, games, error=None):
+        self.games = games
+        self.error = error
+        self.cursors = []
+
+    def find(self, filters, projection=None):
+        cursor = FakeCursor(self, filters)
+        self.cursors.append(cursor)
+        return cursor
+
+
+def make_database(games, error=None):
+    database = Database("mongodb://localhost:27017", "test_database")
+    database.games = FakeGames(games, error)
+    return database
+
+
+def ids(result):
+    return [game["id"] for game in result["games"]]
+
+
+def test_next_cursor_set_when_more_results_remain():
+    database = make_database([make_game(game_id) for game_id in "abc"])
+    result = asyncio.run(database.search_games(limit=2))
+    assert ids(result) == ["a", "b"]
+    assert result["nextCursor"] == "b"
+    # One extra row is requested, and limited on the server
+    assert database.games.cursors[-1].server_limit == 3
+
+    result = asyncio.run(database.search_games(cursor=result["nextCursor"], limit=2))
+    assert ids(result) == ["c"]
+    assert result["nextCursor"] is None
+
+
+def test_no_next_cursor_when_exactly_limit_results():
+    database = make_database([make_game(game_id) for game_id in "ab"])
+    result = asyncio.run(database.search_games(limit=2))
+    assert ids(result) == ["a", "b"]
+    assert result["nextCursor"] is None
+
+
+@pytest.mark.parametrize("code", [115, 238])
+def test_unsupported_backend_falls_back_to_in_memory_index(code):
+    error = OperationFailure("not supported", code=code)
+    database = make_database([make_game("a"), make_game("b", "Weather Types", "Weather", ["RAIN", "SNOW"])], error)
+    result = asyncio.run(database.search_games("anim"))
+    assert ids(result) == ["a"]
+    assert result["nextCursor"] is None
+    assert database.search_index is not None
+    assert len(database.search_index) == 2
+
+
+@pytest.mark.parametrize("code", [27, 50, 85])
+def test_other_operation_failures_are_raised(code):
+    error = OperationFailure("query failed", code=code)
+    database = make_database([make_game("a")], error)
+    with pytest.raises(OperationFailure):
+        asyncio.run(database.search_games("anim"))
+    assert database.search_index is None
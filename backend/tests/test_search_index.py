@@ -0,0 +1,113 @@
+from search_index import GameSearchIndex, search_tokens, tokenize
+
+
+def make_game(game_id, title, categories=(), words=(), level="easy", daily_date=None):
+    return {
+        "id": game_id,
+        "level": level,
+        "title": title,
+        "words": list(words),
+        "groups": [{"category": category, "words": [], "difficulty": 1} for category in categories],
+        "isDaily": daily_date is not None,
+        "dailyDate": daily_date,
+    }
+
+
+def ids(results):
+    return [game["id"] for game in results]
+
+
+def build_index():
+    index = GameSearchIndex()
+    index.add(make_game("a", "Colors and Shapes", ["Animals"], ["DOG", "CAT"]))
+    index.add(make_game("b", "Geography and Culture", ["Desert Features"], ["OASIS"], level="hard"))
+    index.add(make_game("c", "Daily Geography and Culture", ["Desert Features"], ["OASIS"],
+                        level="hard", daily_date="2026-01-02"))
+    index.add(make_game("d", "Daily Colors and Shapes", ["Animals"], ["DOG"],
+                        daily_date="2026-02-02"))
+    return index
+
+
+def test_tokenize_lowercases_and_splits_on_punctuation():
+    assert tokenize("Butterfly Life-Cycle, 2!") == ["butterfly", "life", "cycle", "2"]
+
+
+def test_search_tokens_cover_title_categories_and_words():
+    game = make_game("a", "Home and Family", ["Furniture"], ["BED", "LAMP"])
+    assert search_tokens(game) == ["and", "bed", "family", "furniture", "home", "lamp"]
+
+
+def test_search_matches_token_prefixes():
+    index = build_index()
+    assert ids(index.search("anim")) == ["a", "d"]
+    assert ids(index.search("GEOG")) == ["b", "c"]
+    assert ids(index.search("oasis")) == ["b", "c"]
+
+
+def test_search_matches_any_term():
+    index = build_index()
+    assert ids(index.search("dog oasis")) == ["a", "b", "c", "d"]
+    assert ids(index.search("zebra")) == []
+
+
+def test_query_without_terms_matches_everything():
+    index = build_index()
+    assert ids(index.search("-")) == ["a", "b", "c", "d"]
+
+
+def test_filters_by_level_and_daily():
+    index = build_index()
+    assert ids(index.search(level="hard")) == ["b", "c"]
+    assert ids(index.search(is_daily=False)) == ["a", "b"]
+    assert ids(index.search("culture", level="hard", is_daily=True)) == ["c"]
+
+
+def test_date_range_only_returns_games_in_range():
+    index = build_index()
+    assert ids(index.search(date_from="2026-01-15")) == ["d"]
+    assert ids(index.search(date_to="2026-01-15")) == ["c"]
+    assert ids(index.search(date_from="2026-01-02", date_to="2026-02-02")) == ["c", "d"]
+
+
+def test_cursor_resumes_after_last_id():
+    index = build_index()
+    first_page = index.search(limit=2)
+    assert ids(first_page) == ["a", "b"]
+    assert ids(index.search(cursor=first_page[-1]["id"], limit=2)) == ["c", "d"]
+    # A cursor for a game that no longer exists still resumes in order
+    assert ids(index.search(cursor="bb")) == ["c", "d"]
+
+
+def test_results_are_projected_summaries():
+    index = build_index()
+    assert index.search("oasis", level="hard", is_daily=False) == [{
+        "id": "b",
+        "level": "hard",
+        "title": "Geography and Culture",
+        "isDaily": False,
+        "dailyDate": None,
+        "groups": [{"category": "Desert Features"}],
+    }]
+
+
+def test_re_adding_a_game_replaces_its_tokens():
+    index = build_index()
+    index.add(make_game("a", "Weather Types", ["Weather"], ["RAIN"]))
+    assert len(index) == 4
+    assert ids(index.search("anim")) == ["d"]
+    assert ids(index.search("rain")) == ["a"]
+
+
+def test_remove_drops_game_and_unused_vocabulary():
+    index = build_index()
+    index.remove("a")
+    index.remove("d")
+    assert "a" not in index
+    assert len(index) == 2
+    assert ids(index.search("anim")) == []
+    assert ids(index.search("cat")) == []
+    assert ids(index.search()) == ["b", "c"]
+    assert index._vocabulary == sorted(index._postings)
+    # Removing an unknown id is a no-op
+    index.remove("missing")
+    assert len(index) == 2
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+
+import server
+
+
+@pytest.fixture
+def search_calls(monkeypatch):
+    calls = []
+
+    async def search_games(**kwargs):
+        calls.append(kwargs)
+        return {"games": [], "nextCursor": None}
+
+    monkeypatch.setattr(server.database, "search_games", search_games)
+    return calls
+
+
+@pytest.fixture
+def client():
+    # Not used as a context manager, so startup (seeding, indexes) never runs
+    return TestClient(server.app)
+
+
+def test_search_passes_filters_to_database(client, search_calls):
+    response = client.get("/api/games/search", params={
+        "q": " animals ", "level": "easy", "daily": "true",
+        "dateFrom": "2026-01-05", "dateTo": "2026-01-31", "cursor": "abc", "limit": 5
+    })
+    assert response.status_code == 200
+    assert response.json() == {"games": [], "nextCursor": None}
+    assert search_calls == [{
+        "query": "animals", "level": "easy", "is_daily": True,
+        "date_from": "2026-01-05", "date_to": "2026-01-31", "cursor": "abc", "limit": 5
+    }]
+
+
+def test_search_normalises_unpadded_dates(client, search_calls):
+    response = client.get("/api/games/search", params={"dateFrom": "2026-1-5", "dateTo": "2026-2-1"})
+    assert response.status_code == 200
+    assert search_calls[0]["date_from"] == "2026-01-05"
+    assert search_calls[0]["date_to"] == "2026-02-01"
+
+
+def test_search_rejects_invalid_level(client, search_calls):
+    response = client.get("/api/games/search", params={"level": "expert"})
+    assert response.status_code == 400
+    assert search_calls == []
+
+
+@pytest.mark.parametrize("param", ["dateFrom", "dateTo"])
+def test_search_rejects_bad_dates(client, search_calls, param):
+    response = client.get("/api/games/search", params={param: "2026-13-01"})
+    assert response.status_code == 400
+    assert search_calls == []
+
+
+def test_search_failure_returns_500(client, monkeypatch):
+    async def search_games(**kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(server.database, "search_games", search_games)
+    response = client.get("/api/games/search", params={"q": "animals"})
+    assert response.status_code == 500